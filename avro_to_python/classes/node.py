@@ -5,15 +5,13 @@ from typing import Union
 
 class Node(object):
 
-    def __init__(self, name: str, children: dict={}, files: dict={},
-                 visited: bool=False):
+    def __init__(self, name: str, children: dict={}, files: dict={}):
         """
             Base struct on Node Class
         """
         self.name = name
         self.children = children
         self.files = files
-        self.visited = visited
 
     def __eq__(self, other: Union['Node', str]):
         if isinstance(other, Node):
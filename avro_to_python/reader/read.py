@@ -3,6 +3,7 @@
 import copy
 import os
 import json
+from collections import deque
 
 from avro_to_python.classes.node import Node
 from avro_to_python.classes.file import File
@@ -132,12 +133,12 @@ class AvscReader(object):
         root_node = Node(name='')
 
         # populate queue prior to tree building
-        queue = copy.deepcopy(self.obj['avsc'])
+        queue = deque(copy.deepcopy(self.obj['avsc']))
 
         while queue:
 
             # get first item in queue
-            item = queue.pop(0)
+            item = queue.popleft()
 
             # impute namespace and name
             item['namespace'] = _get_namespace(item)
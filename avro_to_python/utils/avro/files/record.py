@@ -1,6 +1,6 @@
 """ helper function for generating a record file """
 
-from typing import List
+from typing import Deque
 
 from avro_to_python.classes.file import File
 
@@ -17,7 +17,7 @@ from avro_to_python.utils.avro.types.map import _map_field
 from avro_to_python.utils.avro.helpers import _get_namespace
 
 
-def _record_file(file: File, item: dict, queue: List[dict]) -> None:
+def _record_file(file: File, item: dict, queue: Deque[dict]) -> None:
     """ function for adding information for record files
 
     Parameters
@@ -26,8 +26,8 @@ def _record_file(file: File, item: dict, queue: List[dict]) -> None:
             file object containing information from the avro schema
         item: dict
             object to be turned into a file
-        queue: list
-            array of file objects to be processed
+        queue: deque
+            queue of file objects to be processed
 
     Returns
     -------
@@ -98,6 +98,6 @@ def _record_file(file: File, item: dict, queue: List[dict]) -> None:
             raise ValueError('fieldtype is not supported...')
 
         file.fields[field.name] = field
-        file.imports += references
 
-    file.imports = dedupe_imports(file.imports)
+    # references is shared by every field, so only add it once
+    file.imports = dedupe_imports(file.imports + references)
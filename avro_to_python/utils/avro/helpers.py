@@ -91,6 +91,15 @@ def _get_namespace(obj: dict, parent_namespace: str=None) -> str:
         return ''
 
 
+# python type names for each union member fieldtype
+_UNION_TYPE_GETTERS = {
+    'primitive': lambda obj, type_map: type_map.get(obj.avrotype),
+    'reference': lambda obj, type_map: obj.reference_name,
+    'array': lambda obj, type_map: 'list',
+    'map': lambda obj, type_map: 'dict'
+}
+
+
 def get_union_types(
     field: Field,
     PRIMITIVE_TYPE_MAP: dict=PRIMITIVE_TYPE_MAP
@@ -110,33 +119,23 @@ def get_union_types(
             comma seperated string of python types
     """
 
-    out_types = []
-
-    for obj in field.union_types:
-
-        # primitive type
-        if obj.fieldtype == 'primitive':
-            out_types.append(PRIMITIVE_TYPE_MAP.get(obj.avrotype))
-
-        # reference to a named type
-        elif obj.fieldtype == 'reference':
-            out_types.append(obj.reference_name)
+    getters = [
+        _UNION_TYPE_GETTERS.get(obj.fieldtype) for obj in field.union_types
+    ]
+    if None in getters:
+        raise ValueError('unsupported type')
 
-        elif obj.fieldtype == 'array':
-            out_types.append('list')
+    return ','.join([
+        getter(obj, PRIMITIVE_TYPE_MAP)
+        for getter, obj in zip(getters, field.union_types)
+    ])
 
-        elif obj.fieldtype == 'map':
-            out_types.append('dict')
 
-        else:
-            raise ValueError('unsupported type')
-
-    return ','.join(out_types)
-
-
-def dedupe_imports(imports: List[Reference]) -> None:
+def dedupe_imports(imports: List[Reference]) -> List[Reference]:
     """ Dedupes list of imports
 
+    Keeps the order in which each import first appears.
+
     Parameters
     ----------
         imports: list of dict
@@ -144,13 +143,10 @@ def dedupe_imports(imports: List[Reference]) -> None:
 
     Returns
     -------
-        None
+        imports: list of Reference
+            deduped list of imports
     """
-    hashmap = {}
-    for i, obj in enumerate(imports):
-        hashmap[obj.name + obj.namespace] = obj
-
-    return list(hashmap.values())
+    return list({(obj.namespace, obj.name): obj for obj in imports}.values())
 
 
 def split_namespace(s: str) -> Tuple[str, str]:
@@ -167,7 +163,5 @@ def split_namespace(s: str) -> Tuple[str, str]:
             namespace: str
             name: str
     """
-    split = s.split('.')
-    name = split.pop()
-    namespace = '.'.join(split)
+    namespace, _, name = s.rpartition('.')
     return (namespace, name)
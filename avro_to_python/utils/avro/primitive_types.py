@@ -21,3 +21,5 @@ PRIMITIVE_TYPE_MAP = {
     'bytes': 'bytes',
     'string': 'str'
 }
+
+PRIMITIVE_PYTHON_TYPES = frozenset(PRIMITIVE_TYPE_MAP.values())
@@ -1,6 +1,6 @@
 """ helper function to handle array field type """
 
-from typing import Tuple
+from typing import Deque, Tuple
 
 from avro_to_python.classes.field import Field
 
@@ -13,7 +13,7 @@ from avro_to_python.utils.avro.types.type_factory import _get_field_type
 
 def _array_field(field: dict,
                  parent_namespace: str=None,
-                 queue: list=None,
+                 queue: Deque[dict]=None,
                  references: list=[]) -> Tuple[dict, list]:
     """ helper function for adding information to array fields
 
@@ -26,7 +26,7 @@ def _array_field(field: dict,
             array field to extract information from
         parent_namespace: str
             namespace of the parent file
-        queue: list
+        queue: deque
             queue of files to add to project
         references: list
 
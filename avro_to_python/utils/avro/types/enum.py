@@ -1,7 +1,7 @@
 """ handles situation where enum file is referenced in schema """
 
 
-from typing import Tuple
+from typing import Deque, Tuple
 
 from avro_to_python.classes.field import Field
 
@@ -22,7 +22,7 @@ kwargs = {
 
 def _enum_field(field: dict,
                 parent_namespace: str=None,
-                queue: list=None,
+                queue: Deque[dict]=None,
                 references: list=None) -> Tuple[dict, list]:
     """ helper function for adding information to nested enum field
 
@@ -32,7 +32,7 @@ def _enum_field(field: dict,
     ----------
         field: dict
            field object to extract information from
-        queue: list
+        queue: deque
             queue of files to add to project
 
     Returns
@@ -1,6 +1,6 @@
 """ helper function to handle map field type """
 
-from typing import Tuple
+from typing import Deque, Tuple
 
 from avro_to_python.classes.field import Field
 
@@ -13,7 +13,7 @@ from avro_to_python.utils.avro.types.array import _array_field
 
 def _map_field(field: dict,
                parent_namespace: str=None,
-               queue: list=None,
+               queue: Deque[dict]=None,
                references: list=[]) -> Tuple[dict, list]:
     """ helper function for adding information to map fields
 
@@ -26,7 +26,7 @@ def _map_field(field: dict,
             map field to extract information from
         parent_namespace: str
             name of parent file namespace
-        queue: list
+        queue: deque
             queue of files to add to project
         references: list
             list of references already made in file
@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import Deque, Tuple
 
 from avro_to_python.classes.field import Field
 
@@ -18,7 +18,7 @@ kwargs = {
 
 def _record_field(field: dict,
                   parent_namespace: str=None,
-                  queue: list=None,
+                  queue: Deque[dict]=None,
                   references: list=None) -> Tuple[dict, list]:
     """ helper function for adding information to nested record field
 
@@ -28,7 +28,7 @@ def _record_field(field: dict,
     ----------
         field: dict
            field object to extract information from
-        queue: list
+        queue: deque
             queue of files to add to project
 
     Returns
@@ -4,6 +4,10 @@
 from avro_to_python.utils.avro.primitive_types import PRIMITIVE_TYPES
 
 
+# complex types whose type name is also their field type
+COMPLEX_TYPES = frozenset({'array', 'map', 'record', 'enum'})
+
+
 def _get_field_type(field: dict, references: list=None) -> str:
     """ returns the field type from parsed avro field
 
@@ -20,34 +24,24 @@ def _get_field_type(field: dict, references: list=None) -> str:
     """
 
     if isinstance(field['type'], dict):
+        avrotype = field['type']['type']
 
-        # nested array
-        if field['type']['type'] == 'array':
-            return 'array'
-
-        if field['type']['type'] == 'map':
-            return 'map'
-
-        # nested record
-        elif field['type']['type'] == 'record':
-            return 'record'
-
-        # nested enum
-        elif field['type']['type'] == 'enum':
-            return 'enum'
+        # nested array, map, record or enum
+        if avrotype in COMPLEX_TYPES:
+            return avrotype
 
         # logical_types
         elif field['type'].get('logicalType', None):
-            if field['type']['type'] in PRIMITIVE_TYPES:
+            if avrotype in PRIMITIVE_TYPES:
                 return 'primitive'
             else:
                 raise ValueError(
-                    f'{field["type"]["type"]} is not supported.'
+                    f'{avrotype} is not supported.'
                 )
 
         else:
             raise ValueError(
-                f'{field["type"]["type"]} is not supported.'
+                f'{avrotype} is not supported.'
             )
 
     # union type
@@ -59,17 +53,8 @@ def _get_field_type(field: dict, references: list=None) -> str:
         if field['type'] in PRIMITIVE_TYPES:
             return 'primitive'
 
-        elif field['type'] == 'record':
-            return 'record'
-
-        elif field['type'] == 'enum':
-            return 'enum'
-
-        elif field['type'] == 'map':
-            return 'map'
-
-        elif field['type'] == 'array':
-            return 'array'
+        elif field['type'] in COMPLEX_TYPES:
+            return field['type']
 
         # field is a reference to a enum or record
         else:
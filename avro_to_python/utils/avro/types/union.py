@@ -1,6 +1,6 @@
 """ helper function to handle union field type """
 
-from typing import Tuple
+from typing import Deque, Tuple
 
 from avro_to_python.classes.field import Field
 
@@ -16,7 +16,7 @@ from avro_to_python.utils.avro.helpers import _get_namespace
 
 def _union_field(field: dict,
                  parent_namespace: str=None,
-                 queue: list=None,
+                 queue: Deque[dict]=None,
                  references: list=[]) -> Tuple[dict, list]:
     """ helper function for adding information to union fields
 
@@ -29,7 +29,7 @@ def _union_field(field: dict,
             union field to extract information from
         parent_namespace: str
             name of parent file namespace
-        queue: list
+        queue: deque
             queue of files to add to project
         references: list
             list of references already made in file
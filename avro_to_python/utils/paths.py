@@ -37,14 +37,12 @@ def get_avsc_files(directory: str) -> List[str]:
 
     """
     paths = []
-    for root, dirs, files in os.walk(directory):
-        for file in files:
-            if file.endswith('.avsc'):
-                # get the absolute path of file
-                path = os.path.abspath(
-                    os.path.join(root, file)
-                )
-                paths.append(path)
+    # walking an absolute dir yields absolute roots, so files need no abspath
+    for root, dirs, files in os.walk(os.path.abspath(directory)):
+        paths += [
+            os.path.join(root, file) for file in files
+            if file.endswith('.avsc')
+        ]
     return paths
 
 
@@ -2,19 +2,69 @@
 
 import json
 import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 
+from avro_to_python.classes.file import File
 from avro_to_python.classes.node import Node
 from avro_to_python.utils.avro.helpers import get_union_types
-from avro_to_python.utils.avro.primitive_types import PRIMITIVE_TYPE_MAP
+from avro_to_python.utils.avro.primitive_types import (
+    PRIMITIVE_TYPE_MAP, PRIMITIVE_PYTHON_TYPES)
 from avro_to_python.utils.paths import (
     get_system_path, verify_or_create_namespace_path, get_or_create_path,
     get_joined_path)
 
 
-TEMPLATE_PATH = __file__.replace(get_joined_path('writer', 'writer.py'), 'templates/')
-TEMPLATE_PATH = get_system_path(TEMPLATE_PATH)
+TEMPLATE_PATH = get_joined_path(
+    os.path.dirname(os.path.dirname(get_system_path(__file__))), 'templates'
+)
+
+_bytecode_cache_checked = False
+
+# shared by all writers so templates are only compiled once per process,
+# the bytecode cache is attached by the first writer (see _get_bytecode_cache)
+TEMPLATE_ENV = Environment(
+    loader=FileSystemLoader(TEMPLATE_PATH),
+    auto_reload=False,
+    cache_size=-1
+)
+TEMPLATE_ENV.globals.update({
+    'primitive_type_map': PRIMITIVE_TYPE_MAP,
+    'primitive_python_types': PRIMITIVE_PYTHON_TYPES,
+    'get_union_types': get_union_types,
+    'json': json,
+    'enumerate': enumerate
+})
+
+
+def _get_bytecode_cache() -> Optional[FileSystemBytecodeCache]:
+    """ creates a template bytecode cache in the system temp dir
+
+    Jinja picks a per-user dir in the temp dir and refuses it unless it
+    is a private, real directory owned by the current user. The cache
+    only skips recompiling templates on later runs, so any problem with
+    that dir disables it instead of failing.
+
+    Returns
+    -------
+        bytecode_cache: FileSystemBytecodeCache or None
+            None if the cache dir can not be used safely
+    """
+    try:
+        return FileSystemBytecodeCache()
+    except (OSError, RuntimeError):
+        return None
+
+
+def _init_bytecode_cache() -> None:
+    """ attaches the bytecode cache to TEMPLATE_ENV once per process """
+    global _bytecode_cache_checked
+    if not _bytecode_cache_checked:
+        TEMPLATE_ENV.bytecode_cache = _get_bytecode_cache()
+        _bytecode_cache_checked = True
 
 
 class AvroWriter(object):
@@ -24,26 +74,21 @@ class AvroWriter(object):
 
     {
         'children': {},
-        'files': {},
-        'visited': False
+        'files': {}
     }
 
     The "keys" of the children are the namespace names along avro
     namespace paths. The Files are the actual files within the
     namespace that need to be compiled.
 
-    Note: The visited flag in each node is only for node traversal.
-
     This results in the following behavior given this sample tree:
 
     tree = {
         'children': {'test': {
             'children': {},
-            'files': {'NestedTest': ...},
-            'visited': False
+            'files': {'NestedTest': ...}
         }},
-        'files': {'Test' ...},
-        'visited': False
+        'files': {'Test' ...}
     }
 
     files generated:
@@ -87,8 +132,14 @@ class AvroWriter(object):
         self.tree = tree
 
         # jinja2 templates
-        self.template_env = Environment(loader=FileSystemLoader(TEMPLATE_PATH))
+        _init_bytecode_cache()
+        self.template_env = TEMPLATE_ENV
         self.template = self.template_env.get_template('baseTemplate.j2')
+        self.init_template = self.template_env.get_template('files/init.j2')
+        self.helpers_template = self.template_env.get_template('files/helpers.j2')  # NOQA
+        self.setup_template = self.template_env.get_template('files/setup.j2')
+        self.pip_init_template = self.template_env.get_template('files/pip_init.j2')  # NOQA
+        self.manifest_template = self.template_env.get_template('files/manifest.j2')  # NOQA
 
     def write(self, root_dir: str) -> None:
         """ Public runner method for writing all files in a tree
@@ -118,83 +169,100 @@ class AvroWriter(object):
         get_or_create_path(self.top_level_package_dir)
         self._write_helper_file()
 
-        self._reset_tree()
-        self._dfs(self.tree)
+        nodes = self._walk_tree()
+
+        # create each namespace dir once, before any file is written to it
+        for namespace, _ in nodes:
+            verify_or_create_namespace_path(
+                rootdir=self.top_level_package_dir,
+                namespace=namespace
+            )
+
+        # files render and write independently of each other, so spread
+        # them over a thread pool; list() re-raises any error from a job
+        with ThreadPoolExecutor() as executor:
+            list(executor.map(
+                lambda job: self._write_namespace_file(*job),
+                [(namespace, filename, file)
+                 for namespace, node in nodes
+                 for filename, file in node.files.items()]
+            ))
+
+        # add __init__ files for correct imports
+        for namespace, node in nodes:
+            self._write_init_file(
+                imports={
+                    file.namespace + '.' + file.name
+                    for file in node.files.values()
+                },
+                namespace=namespace
+            )
 
         if self.pip:
             self._write_setup_file()
             self._write_pip_init_file()
             self._write_manifest_file()
 
+    def _write_text(self, filepath: str, filetext: str) -> None:
+        """ writes rendered filetext to filepath as utf-8 in a single call """
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(filetext)
+
     def _write_manifest_file(self) -> None:
         """ writes manifest to recursively include packages """
         filepath = self.root_dir + '/MANIFEST.in'
-        template = self.template_env.get_template('files/manifest.j2')
-        filetext = template.render(
+        filetext = self.manifest_template.render(
             pip = self.pip
         )
-        with open(filepath, 'w') as f:
-            f.write(filetext)
+        self._write_text(filepath=filepath, filetext=filetext)
 
     def _write_setup_file(self) -> None:
         """ writes the setup.py file to the pip dir"""
         filepath = self.root_dir + '/setup.py'
-        template = self.template_env.get_template('files/setup.j2')
-        filetext = template.render(
+        filetext = self.setup_template.render(
             pip=self.pip,
             author=self.author,
             package_version=self.package_version
         )
-        with open(filepath, 'w') as f:
-            f.write(filetext)
+        self._write_text(filepath=filepath, filetext=filetext)
 
     def _write_pip_init_file(self) -> None:
         """ writes the __init__ file to the pip dir"""
         filepath = self.top_level_package_dir + '/__init__.py'
-        template = self.template_env.get_template('files/pip_init.j2')
-        filetext = template.render(
+        filetext = self.pip_init_template.render(
             pip=self.pip,
             author=self.author,
             package_version=self.package_version
         )
-        with open(filepath, 'w') as f:
-            f.write(filetext)
+        self._write_text(filepath=filepath, filetext=filetext)
 
     def _write_helper_file(self) -> None:
         """ writes the helper file to the root dir """
         filepath = self.top_level_package_dir + '/helpers.py'
-        template = self.template_env.get_template('files/helpers.j2')
-        filetext = template.render()
-        with open(filepath, 'w') as f:
-            f.write(filetext)
+        filetext = self.helpers_template.render()
+        self._write_text(filepath=filepath, filetext=filetext)
 
     def _write_init_file(self, imports: set, namespace: str) -> None:
-        """ writes __init__.py files for namespace imports"""
-        template = self.template_env.get_template('files/init.j2')
-        filetext = template.render(
+        """ writes __init__.py files for namespace imports
+
+        The namespace dir is expected to exist already.
+        """
+        filetext = self.init_template.render(
             imports=sorted(imports),
             pip_import=self.pip_import
         )
-        verify_or_create_namespace_path(
-            rootdir=self.top_level_package_dir,
-            namespace=namespace
-        )
         filepath = self.top_level_package_dir + namespace.replace('.', '/') + '/' + '__init__.py'  # NOQA
-        with open(filepath, 'w') as f:
-            f.write(filetext)
+        self._write_text(filepath=filepath, filetext=filetext)
 
     def _write_file(
         self, filename: str, filetext: str, namespace: str
     ) -> None:
         """ writes python filetext to appropriate namespace
+
+        The namespace dir is expected to exist already.
         """
-        verify_or_create_namespace_path(
-            rootdir=self.top_level_package_dir,
-            namespace=namespace
-        )
         filepath = self.top_level_package_dir + namespace.replace('.', '/') + '/' + filename + '.py'  # NOQA
-        with open(filepath, 'w') as f:
-            f.write(filetext)
+        self._write_text(filepath=filepath, filetext=filetext)
 
     def _render_file(self, file: dict) -> str:
         """ compiles a file obj into python
@@ -211,80 +279,49 @@ class AvroWriter(object):
         """
         filetext = self.template.render(
             file=file,
-            primitive_type_map=PRIMITIVE_TYPE_MAP,
-            get_union_types=get_union_types,
-            json=json,
-            pip_import=self.pip_import,
-            enumerate=enumerate
+            pip_import=self.pip_import
         )
         return filetext
 
-    def _reset_tree(self, node: Node=None) -> None:
-        """ resets the visited flags in node objects
-
-        Parameters
-        ----------
-            node:
-                Node
+    def _walk_tree(self) -> List[Tuple[str, Node]]:
+        """ collects every node in the tree with its namespace in one pass
 
         Returns
         -------
-            None
+            nodes: list of tuple
+                (namespace, node) pairs in breadth first order
         """
-        # mark as visited
-        if not node:
-            node = self.tree
-
-        node.visited = False
-
-        for name in node.children:
-            if node.children[name].visited:
-                self._reset_tree(node=node.children[name])
+        nodes = []
+        queue = deque([('', self.tree)])
+        while queue:
+            namespace, node = queue.popleft()
+            nodes.append((namespace, node))
+            queue.extend(
+                (namespace + '.' + name, child)
+                for name, child in node.children.items()
+            )
+        return nodes
 
-    def _dfs(self, node: Node=None, namespace: str='') -> None:
-        """ yields files from tree via DFS
+    def _write_namespace_file(
+        self, namespace: str, filename: str, file: File
+    ) -> None:
+        """ renders a single file and writes it to its namespace
 
         Parameters
         ----------
-            node: Node
-               node in graph for traversal
-               if not specified, will use root of tree
+            namespace: str
+                period seperated namespace of the file
+            filename: str
+                name of the file without extension
+            file: File
+                file obj representing an avro file
 
         Returns
         -------
-            file: dict
-                file object representing avro record or enum
+            None
         """
-
-        # initialize stack from root node
-
-        # mark as visited
-        if not node:
-            node = self.tree
-
-        node.visited = True
-
-        imports = set()
-        for filename, file in node.files.items():
-            filetext = self._render_file(file=file)
-            self._write_file(
-                filename=filename,
-                filetext=filetext,
-                namespace=namespace
-            )
-            imports.add(
-                file.namespace + '.' + file.name
-            )
-
-        # add __init__ files for correct imports
-        self._write_init_file(
-            imports=imports, namespace=namespace
+        self._write_file(
+            filename=filename,
+            filetext=self._render_file(file=file),
+            namespace=namespace
         )
-
-        # add non-visited children to stack
-        for name in node.children:
-            if not node.children[name].visited:
-                self._dfs(
-                    node=node.children[name],
-                    namespace=namespace + '.' + name
-                )
@@ -1,9 +1,11 @@
 """ tests helper avro reader functions """
 
 import unittest
+from avro_to_python.classes.field import Field
 from avro_to_python.classes.reference import Reference
 from avro_to_python.utils.avro.helpers import (
-    _create_reference, _get_namespace, dedupe_imports
+    _create_reference, _get_namespace, dedupe_imports, get_union_types,
+    split_namespace
 )
 from avro_to_python.utils.exceptions import BadReferenceError
 
@@ -109,3 +111,50 @@ class AvroHelperTests(unittest.TestCase):
             expected,
             dedupe_imports(has_dupes)
         )
+
+        # name and namespace must not be compared as one joined string
+        distinct = [
+            Reference(**{'name': 'Test', 'namespace': 'test.namespace'}),
+            Reference(**{'name': 'Testt', 'namespace': 'est.namespace'})
+        ]
+
+        self.assertEqual(
+            2,
+            len(dedupe_imports(distinct))
+        )
+
+    def test_get_union_types(self):
+        """ tests the get_union_types helper function works """
+
+        field = Field(name='test', fieldtype='union', union_types=[
+            Field(name='uniontype', fieldtype='primitive', avrotype='null'),
+            Field(name='uniontype', fieldtype='primitive', avrotype='long'),
+            Field(name='uniontype', fieldtype='reference',
+                  reference_name='Thing'),
+            Field(name='arraytype', fieldtype='array'),
+            Field(name='uniontype', fieldtype='map')
+        ])
+
+        self.assertEqual(
+            'None,int,Thing,list,dict',
+            get_union_types(field)
+        )
+
+        bad_field = Field(name='test', fieldtype='union', union_types=[
+            Field(name='uniontype', fieldtype='union')
+        ])
+
+        with self.assertRaises(ValueError):
+            get_union_types(bad_field)
+
+    def test_split_namespace(self):
+        """ tests the split_namespace helper function works """
+
+        self.assertEqual(
+            ('test.namespace', 'Test'),
+            split_namespace('test.namespace.Test')
+        )
+        self.assertEqual(
+            ('', 'Test'),
+            split_namespace('Test')
+        )
@@ -0,0 +1,88 @@
+""" tests the writer's template bytecode cache handling """
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import avro_to_python
+from avro_to_python.reader.read import AvscReader
+from avro_to_python.utils.paths import get_joined_path
+from avro_to_python.writer import writer
+
+
+@unittest.skipUnless(hasattr(os, 'getuid'), 'per-user cache dirs are posix')
+class BytecodeCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        """ remember the shared cache state so it can be restored """
+        self.bytecode_cache = writer.TEMPLATE_ENV.bytecode_cache
+        self.checked = writer._bytecode_cache_checked
+        self.tmp = tempfile.TemporaryDirectory()
+        self.source = os.path.abspath(avro_to_python.__file__) \
+            .replace(get_joined_path('avro_to_python', '__init__.py'), 'tests/avsc/records')  # NOQA
+
+    def tearDown(self):
+        writer.TEMPLATE_ENV.bytecode_cache = self.bytecode_cache
+        writer._bytecode_cache_checked = self.checked
+        self.tmp.cleanup()
+
+    def _cache_dir(self, uid: int) -> str:
+        """ path of the per-user jinja cache dir for uid in the temp dir """
+        return os.path.join(self.tmp.name, f'_jinja2-cache-{uid}')
+
+    def _get_bytecode_cache(self):
+        """ builds the cache with the test temp dir as system temp dir """
+        with mock.patch.object(tempfile, 'tempdir', self.tmp.name):
+            return writer._get_bytecode_cache()
+
+    def test_cache_dir_is_per_user(self):
+        """ another user's existing cache dir should not disable ours """
+
+        other_dir = self._cache_dir(os.getuid() + 1)
+        os.mkdir(other_dir, 0o700)
+        if os.geteuid() == 0:
+            os.chown(other_dir, os.getuid() + 1, -1)
+
+        bytecode_cache = self._get_bytecode_cache()
+
+        self.assertIsNotNone(bytecode_cache)
+        self.assertEqual(
+            self._cache_dir(os.getuid()),
+            bytecode_cache.directory
+        )
+
+    def test_symlinked_cache_dir(self):
+        """ a symlink in place of the cache dir should disable the cache """
+
+        private_dir = os.path.join(self.tmp.name, 'private')
+        os.mkdir(private_dir, 0o700)
+        os.symlink(private_dir, self._cache_dir(os.getuid()))
+
+        self.assertIsNone(self._get_bytecode_cache())
+
+    def test_unusable_cache_dir(self):
+        """ a file in place of the cache dir should disable the cache """
+
+        open(self._cache_dir(os.getuid()), 'w').close()
+        writer._bytecode_cache_checked = False
+
+        reader = AvscReader(directory=self.source)
+        reader.read()
+        with mock.patch.object(tempfile, 'tempdir', self.tmp.name):
+            avro_writer = writer.AvroWriter(reader.file_tree)
+
+        self.assertIsNone(writer.TEMPLATE_ENV.bytecode_cache)
+
+        write_path = os.path.join(self.tmp.name, 'out')
+        avro_writer.write(root_dir=write_path)
+        self.assertTrue(
+            os.path.isfile(os.path.join(write_path, 'records', 'Thing.py'))
+        )
+
+    def test_missing_temp_dir(self):
+        """ no usable temp dir at all should disable the cache """
+
+        with mock.patch.object(tempfile, 'gettempdir',
+                               side_effect=FileNotFoundError):
+            self.assertIsNone(writer._get_bytecode_cache())